@@ -26,6 +26,13 @@ namespace NodPT.Data.DTOs
         [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
         public List<OllamaMessage>? messages { get; set; }
 
+        /// <summary>
+        /// How long Ollama keeps the model (and its KV cache) loaded after this request, e.g. "30m" or "-1" for forever
+        /// </summary>
+        [JsonPropertyName("keep_alive")]
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string? keep_alive { get; set; }
+
         [JsonPropertyName("images")]
         [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
         public List<string>? images { get; set; }
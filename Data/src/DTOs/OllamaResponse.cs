@@ -24,6 +24,16 @@ namespace NodPT.Data.DTOs
 
         public bool done { get; set; }
 
+        /// <summary>
+        /// Number of prompt tokens evaluated by the model's tokenizer (set on the final response)
+        /// </summary>
+        public int? prompt_eval_count { get; set; }
+
+        /// <summary>
+        /// Number of tokens generated in the response (set on the final response)
+        /// </summary>
+        public int? eval_count { get; set; }
+
         /// <summary>
         /// Gets the content from either response (generate) or message.content (chat).
         /// Priority: response field takes precedence over message.content to support /api/generate endpoint first,
@@ -25,5 +25,10 @@ namespace NodPT.Data.DTOs
         /// Maximum length of the summary in characters.
         /// </summary>
         public int MaxSummaryLength { get; set; } = 2000;
+
+        /// <summary>
+        /// How long Ollama keeps the summarization model loaded after a request (Ollama keep_alive, e.g. "30m").
+        /// </summary>
+        public string KeepAlive { get; set; } = "30m";
     }
 }
@@ -16,12 +16,12 @@ public class MessageEnvelope
 public class ListenOptions
 {
     /// <summary>
-    /// Number of messages to read per batch (default: 10)
+    /// Maximum number of messages to read per call; a read never asks for more than the free handler slots (default: 10)
     /// </summary>
     public int BatchSize { get; set; } = 10;
 
     /// <summary>
-    /// Number of concurrent message handlers (default: 1)
+    /// Number of concurrent message handlers; a new message is read as soon as one finishes (default: 1)
     /// </summary>
     public int Concurrency { get; set; } = 1;
 
@@ -52,6 +52,18 @@ public class ListenOptions
 
 }
 
+/// <summary>
+/// Thrown by a Listen handler when a message can never succeed (e.g. the request is rejected as invalid).
+/// The message is moved to the dead letter stream immediately instead of being retried.
+/// </summary>
+public class NonRetryableMessageException : Exception
+{
+    public NonRetryableMessageException(string message, Exception? innerException = null)
+        : base(message, innerException)
+    {
+    }
+}
+
 /// <summary>
 /// Handle for a Listen operation that can be used to stop it
 /// </summary>
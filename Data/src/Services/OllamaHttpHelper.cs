@@ -0,0 +1,48 @@
+using System.Net.Http.Headers;
+using System.Text.Json;
+
+namespace NodPT.Data.Services;
+
+/// <summary>
+/// Shared HTTP plumbing for the services that call the Ollama API.
+/// </summary>
+public static class OllamaHttpHelper
+{
+    /// <summary>
+    /// Wrap an already serialized UTF-8 JSON payload as request content.
+    /// The body is sent in one buffer with a Content-Length header rather than chunked.
+    /// </summary>
+    public static ByteArrayContent CreateJsonContent(byte[] utf8Json)
+    {
+        var content = new ByteArrayContent(utf8Json);
+        content.Headers.ContentType = new MediaTypeHeaderValue("application/json") { CharSet = "utf-8" };
+        return content;
+    }
+
+    /// <summary>
+    /// Serialize a request straight to UTF-8 JSON content, without an intermediate string.
+    /// </summary>
+    public static ByteArrayContent CreateJsonContent<T>(T request)
+    {
+        return CreateJsonContent(JsonSerializer.SerializeToUtf8Bytes(request));
+    }
+
+    /// <summary>
+    /// Throw <see cref="HttpRequestException"/> for a non-success response. Ollama explains failures
+    /// (unknown model, context overflow, ...) in an {"error": ...} body, so the body goes into the
+    /// exception message and whoever catches it logs the reason once, together with the status.
+    /// </summary>
+    public static async Task EnsureSuccessAsync(HttpResponseMessage response, CancellationToken cancellationToken = default)
+    {
+        if (response.IsSuccessStatusCode)
+        {
+            return;
+        }
+
+        var errorBody = await response.Content.ReadAsStringAsync(cancellationToken);
+        throw new HttpRequestException(
+            $"Ollama returned {(int)response.StatusCode} ({response.ReasonPhrase}): {errorBody}",
+            null,
+            response.StatusCode);
+    }
+}
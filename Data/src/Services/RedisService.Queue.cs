@@ -158,7 +158,9 @@ public class RedisQueueService
     /// <param name="consumerName">Unique name for this consumer instance (e.g., "executor-host1-abc123").</param>
     /// <param name="handler">
     /// Async callback invoked for each message. Return true to acknowledge (success),
-    /// false to trigger retry. After max retries, message moves to dead letter stream.
+    /// false to trigger retry (the message is read again after a 1s, 2s, 4s... backoff).
+    /// After max retries, message moves to dead letter stream.
+    /// Throw <see cref="NonRetryableMessageException"/> to move it to the dead letter stream immediately.
     /// </param>
     /// <param name="options">Optional configuration for batch size, concurrency, retries, etc.</param>
     /// <returns>A handle to control the listener (use with <see cref="StopListen"/>).</returns>
@@ -235,63 +237,87 @@ public class RedisQueueService
 
                 _logger.LogInformation($"Started listening to Redis stream {streamKey} with group {group} as {consumerName}");
 
-                // Main processing loop
-                while (!cancellationToken.IsCancellationRequested)
+                // Main processing loop: keep up to Concurrency handlers running and read the next
+                // message as soon as one finishes, so a slow message never holds back the others
+                var slots = new SemaphoreSlim(options.Concurrency, options.Concurrency);
+                var inFlight = new ConcurrentDictionary<string, byte>();
+                var retryAfter = new ConcurrentDictionary<string, DateTime>();
+                try
                 {
-                    try
+                    while (!cancellationToken.IsCancellationRequested)
                     {
-                        // Read messages from stream
-                        var entries = await db.StreamReadGroupAsync(
-                            streamKey,
-                            group,
-                            consumerName,
-                            ">",
-                            count: options.BatchSize,
-                            noAck: false);
-
-                        if (entries.Length > 0)
+                        var acquired = 0;
+                        try
                         {
-                            // Process messages concurrently if configured
-                            var tasks = new List<Task>();
-                            using (var semaphore = new SemaphoreSlim(options.Concurrency, options.Concurrency))
+                            // Wait for a free handler slot, then take any other free ones
+                            // (only this loop acquires slots, so Wait(0) never blocks)
+                            await slots.WaitAsync(cancellationToken);
+                            acquired = 1;
+                            while (acquired < options.BatchSize && slots.Wait(0))
+                            {
+                                acquired++;
+                            }
+
+                            // Read at most one message per free slot, failed ones due for a retry first
+                            var entries = await ReadNextEntries(db, streamKey, group, consumerName, acquired, inFlight, retryAfter);
+
+                            // Give back the slots this read did not fill
+                            if (entries.Length < acquired)
+                            {
+                                slots.Release(acquired - entries.Length);
+                            }
+                            acquired = 0;
+
+                            foreach (var entry in entries)
                             {
-                                foreach (var entry in entries)
+                                var entryId = entry.Id.ToString();
+                                inFlight[entryId] = 0;
+
+                                // Not bound to the token: the slot must always be released
+                                _ = Task.Run(async () =>
                                 {
-                                    await semaphore.WaitAsync(cancellationToken);
-                                    
-                                    var task = Task.Run(async () =>
+                                    try
+                                    {
+                                        await ProcessMessage(db, streamKey, group, entry, handler, options, retryAfter, cancellationToken);
+                                    }
+                                    finally
                                     {
-                                        try
-                                        {
-                                            await ProcessMessage(db, streamKey, group, entry, handler, options, cancellationToken);
-                                        }
-                                        finally
-                                        {
-                                            semaphore.Release();
-                                        }
-                                    }, cancellationToken);
-
-                                    tasks.Add(task);
-                                }
-
-                                // Wait for all messages in this batch to complete
-                                await Task.WhenAll(tasks);
+                                        inFlight.TryRemove(entryId, out _);
+                                        slots.Release();
+                                    }
+                                });
+                            }
+
+                            if (entries.Length == 0)
+                            {
+                                // No messages, wait before polling again
+                                await Task.Delay(options.PollDelayMs, cancellationToken);
                             }
                         }
-                        else
+                        catch (OperationCanceledException)
                         {
-                            // No messages, wait before polling again
-                            await Task.Delay(options.PollDelayMs, cancellationToken);
+                            break;
+                        }
+                        catch (Exception ex)
+                        {
+                            _logger.LogError(ex, $"Error reading from Redis stream {streamKey}");
+                            await Task.Delay(5000, cancellationToken); // Wait before retrying
+                        }
+                        finally
+                        {
+                            if (acquired > 0)
+                            {
+                                slots.Release(acquired);
+                            }
                         }
                     }
-                    catch (OperationCanceledException)
-                    {
-                        break;
-                    }
-                    catch (Exception ex)
+                }
+                finally
+                {
+                    // Let in-flight handlers finish before the listener reports that it stopped
+                    for (var i = 0; i < options.Concurrency; i++)
                     {
-                        _logger.LogError(ex, $"Error reading from Redis stream {streamKey}");
-                        await Task.Delay(5000, cancellationToken); // Wait before retrying
+                        await slots.WaitAsync();
                     }
                 }
 
@@ -306,12 +332,70 @@ public class RedisQueueService
         return handle;
     }
 
+    /// <summary>
+    /// Reads up to <paramref name="count"/> messages for a consumer. Messages already delivered to it
+    /// (failed ones whose retry delay has passed, or ones claimed on startup) come first, then new ones.
+    /// </summary>
+    private async Task<StreamEntry[]> ReadNextEntries(IDatabase db, string streamKey, string group,
+        string consumerName, int count, ConcurrentDictionary<string, byte> inFlight,
+        ConcurrentDictionary<string, DateTime> retryAfter)
+    {
+        var entries = new List<StreamEntry>(count);
+
+        // "0" returns the consumer's pending list, which also holds the messages still being processed
+        var pending = await db.StreamReadGroupAsync(
+            streamKey,
+            group,
+            consumerName,
+            "0",
+            count: count + inFlight.Count + retryAfter.Count,
+            noAck: false);
+
+        var now = DateTime.UtcNow;
+        foreach (var entry in pending)
+        {
+            var entryId = entry.Id.ToString();
+            if (inFlight.ContainsKey(entryId) ||
+                (retryAfter.TryGetValue(entryId, out var due) && due > now))
+            {
+                continue;
+            }
+
+            if (entry.Values == null || entry.Values.Length == 0)
+            {
+                // Deleted from the stream while pending; nothing left to process
+                await db.StreamAcknowledgeAsync(streamKey, group, entry.Id);
+                retryAfter.TryRemove(entryId, out _);
+                continue;
+            }
+
+            entries.Add(entry);
+            if (entries.Count == count)
+            {
+                return entries.ToArray();
+            }
+        }
+
+        var newEntries = await db.StreamReadGroupAsync(
+            streamKey,
+            group,
+            consumerName,
+            ">",
+            count: count - entries.Count,
+            noAck: false);
+
+        entries.AddRange(newEntries);
+        return entries.ToArray();
+    }
+
     /// <summary>
     /// Processes a single message from the stream, calling the handler and managing acknowledgment/retry.
+    /// A failed message stays pending and is read again once its backoff delay in <paramref name="retryAfter"/> has passed.
     /// </summary>
     private async Task ProcessMessage(IDatabase db, string streamKey, string group, 
         StreamEntry entry, Func<MessageEnvelope, CancellationToken, Task<bool>> handler,
-        ListenOptions options, CancellationToken cancellationToken)
+        ListenOptions options, ConcurrentDictionary<string, DateTime> retryAfter,
+        CancellationToken cancellationToken)
     {
         var entryId = entry.Id.ToString();
         var retryKey = $"{streamKey}:{entryId}";
@@ -338,6 +422,7 @@ public class RedisQueueService
                 
                 // Remove retry counter
                 _retryCounters.TryRemove(retryKey, out _);
+                retryAfter.TryRemove(entryId, out _);
                 
                 _logger.LogDebug($"Successfully processed and acknowledged message {entryId}");
             }
@@ -351,15 +436,26 @@ public class RedisQueueService
                     // Move to dead letter stream
                     await MoveToDeadLetter(db, streamKey, group, entry);
                     _retryCounters.TryRemove(retryKey, out _);
+                    retryAfter.TryRemove(entryId, out _);
                     
                     _logger.LogWarning($"Message {entryId} moved to dead letter after {retryCount} retries");
                 }
                 else
                 {
+                    retryAfter[entryId] = DateTime.UtcNow.AddMilliseconds(CalculateExponentialBackoffDelay(retryCount - 1));
                     _logger.LogWarning($"Message {entryId} failed, retry {retryCount}/{options.MaxRetries}");
                 }
             }
         }
+        catch (NonRetryableMessageException ex)
+        {
+            // Retrying the same message would fail the same way, so skip the remaining retries
+            _logger.LogError(ex, $"Message {entryId} from stream {streamKey} cannot succeed, moving to dead letter without retry");
+            
+            await MoveToDeadLetter(db, streamKey, group, entry);
+            _retryCounters.TryRemove(retryKey, out _);
+            retryAfter.TryRemove(entryId, out _);
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, $"Error processing message {entryId} from stream {streamKey}");
@@ -372,9 +468,14 @@ public class RedisQueueService
                 // Move to dead letter stream
                 await MoveToDeadLetter(db, streamKey, group, entry);
                 _retryCounters.TryRemove(retryKey, out _);
+                retryAfter.TryRemove(entryId, out _);
                 
                 _logger.LogError($"Message {entryId} moved to dead letter after {retryCount} failed attempts");
             }
+            else
+            {
+                retryAfter[entryId] = DateTime.UtcNow.AddMilliseconds(CalculateExponentialBackoffDelay(retryCount - 1));
+            }
         }
     }
 
@@ -449,7 +550,8 @@ public class RedisQueueService
     /// in the pending entries list (PEL). This method allows other consumers to claim
     /// ownership of those messages and retry processing them.
     /// 
-    /// This is typically called on consumer startup to recover from previous failures.
+    /// This is typically called on consumer startup to recover from previous failures;
+    /// the claimed messages are then processed by the consumer's Listen loop.
     /// </summary>
     /// <param name="streamKey">The Redis Stream key.</param>
     /// <param name="group">The consumer group name.</param>
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
@@ -14,6 +15,45 @@ public class SummarizationService
     private readonly SummarizationOptions _options;
     private readonly ILogger<SummarizationService> _logger;
 
+    /// <summary>
+    /// How long role instructions loaded from SummarizePrompts are reused before the table is read again.
+    /// </summary>
+    private static readonly TimeSpan RolePromptCacheDuration = TimeSpan.FromMinutes(5);
+
+    /// <summary>
+    /// Role instructions keyed by lower-case role, with the time they were loaded.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, (DateTime LoadedAt, List<string> Prompts)> _rolePromptCache = new();
+
+    private const string DefaultInstructionsPrefix = " Integrate the key information from the new message into the summary. " +
+        "Preserve all important facts, constraints, and decisions.";
+
+    private const string DefaultInstructionsRules = " RULES: " +
+        "Preserve all important facts, constraints, preferences, instructions, and decisions from the existing summary.\r\n2. " +
+        "Integrate relevant new information from the new message.\r\n3. Do not invent or assume information not present in the inputs.\r\n4. " +
+        "Output ONLY the updated summary text, no explanations or meta-commentary.\r\n5. Keep the summary concise but complete.\r\n6. " +
+        "Use clear, factual language.";
+
+    /// <summary>
+    /// Fallback instructions used when no SummarizePrompts exist for the role, concatenated at compile time.
+    /// </summary>
+    private const string DefaultUserInstructions = DefaultInstructionsPrefix + @"Focus on integrating from the new user message:
+    - New goals, tasks, and questions
+    - New constraints (time, budget, technology)
+    - New preferences (style, tone, priorities)
+    - New contextual facts provided by the user
+    Non-essential chatter can be compressed as long as meaning is preserved." + DefaultInstructionsRules;
+
+    private const string DefaultAssistantInstructions = DefaultInstructionsPrefix + @"Focus on integrating from the AI assistant message:
+    - Final answers and solutions provided
+    - Frameworks or plans laid out
+    - Decisions or commitments made
+    - Clarifications or interpretations that affect future reasoning
+    The actual wording is not important; extract the key decisions and information." + DefaultInstructionsRules;
+
+    private const string DefaultOtherInstructions = DefaultInstructionsPrefix + @"Integrate the key information from the new message into the summary.
+    Preserve all important facts, constraints, and decisions." + DefaultInstructionsRules;
+
     public SummarizationService(
         HttpClient httpClient,
         SummarizationOptions options,
@@ -45,18 +85,18 @@ public class SummarizationService
             {
                 model = _options.Model,
                 prompt = prompt,
+                keep_alive = _options.KeepAlive,
             };
 
-            var json = JsonSerializer.Serialize(request);
-            using var content = new StringContent(json, Encoding.UTF8, "application/json");
+            using var content = OllamaHttpHelper.CreateJsonContent(request);
             _logger.LogDebug("Sending summarization request to {Endpoint}, Model: {Model}, Role: {Role}",
              _options.BaseUrl, _options.Model, role);
             // Send the request
-            var response = await _httpClient.PostAsync(_options.BaseUrl, content, cancellationToken);
-            response.EnsureSuccessStatusCode();
+            using var response = await _httpClient.PostAsync(_options.BaseUrl, content, cancellationToken);
+            await OllamaHttpHelper.EnsureSuccessAsync(response, cancellationToken);
             // Parse the response
-            var responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
-            var responseObject = JsonSerializer.Deserialize<OllamaResponse>(responseJson);
+            await using var responseStream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            var responseObject = await JsonSerializer.DeserializeAsync<OllamaResponse>(responseStream, cancellationToken: cancellationToken);
 
             if (responseObject == null || string.IsNullOrEmpty(responseObject.Content))
             {
@@ -100,59 +140,64 @@ public class SummarizationService
     /// </summary>
     private string BuildSummarizationPrompt(string oldSummary, string newMessageContent, string role)
     {
-
-        UnitOfWork? session = DatabaseHelper.GetSession();
-        if (session == null)
+        // get the role instructions
+        var data = GetRolePrompts(role);
+        if (data == null)
             return string.Empty;
 
-        // get the role instructions
-        IQueryable<SummarizePrompts> data = session.Query<SummarizePrompts>()
-            .Where(x => x.Role.ToLower() == role.ToLower());
+        // Pre-size for the inputs plus the fixed instruction text to avoid repeated reallocation
+        var prompt = new StringBuilder(oldSummary.Length + newMessageContent.Length + 1024);
+
+        if (!string.IsNullOrEmpty(oldSummary))
+            prompt.Append("EXISTING SUMMARY: ").Append(oldSummary);
 
-        var prompt = string.IsNullOrEmpty(oldSummary) ? string.Empty : $"EXISTING SUMMARY: {oldSummary}";
-        prompt += $"NEW MESSAGE (from {role}): {newMessageContent}" +
-                $"INSTRUCTIONS:";
+        prompt.Append("NEW MESSAGE (from ").Append(role).Append("): ").Append(newMessageContent)
+            .Append("INSTRUCTIONS:");
 
-        if (data.Any())
+        if (data.Count > 0)
         {
             foreach (var item in data)
             {
-                prompt += $" {item.Prompt}. ";
+                prompt.Append(' ').Append(item).Append(". ");
             }
         }
         else
         {
-            prompt += " Integrate the key information from the new message into the summary. " +
-                "Preserve all important facts, constraints, and decisions.";
-
-
-            prompt += role.ToLowerInvariant() switch
+            prompt.Append(role.ToLowerInvariant() switch
             {
-                "user" => @"Focus on integrating from the new user message:
-    - New goals, tasks, and questions
-    - New constraints (time, budget, technology)
-    - New preferences (style, tone, priorities)
-    - New contextual facts provided by the user
-    Non-essential chatter can be compressed as long as meaning is preserved.",
+                "user" => DefaultUserInstructions,
+                "assistant" => DefaultAssistantInstructions,
+                _ => DefaultOtherInstructions
+            });
+        }
 
-                "assistant" => @"Focus on integrating from the AI assistant message:
-    - Final answers and solutions provided
-    - Frameworks or plans laid out
-    - Decisions or commitments made
-    - Clarifications or interpretations that affect future reasoning
-    The actual wording is not important; extract the key decisions and information.",
+        return prompt.ToString();
+    }
 
-                _ => @"Integrate the key information from the new message into the summary.
-    Preserve all important facts, constraints, and decisions."
-            };
+    /// <summary>
+    /// Get the summarization instructions for a role, reading the database at most once per cache period.
+    /// Returns null when no database session is available.
+    /// </summary>
+    private static List<string>? GetRolePrompts(string role)
+    {
+        var key = role.ToLowerInvariant();
 
-            prompt += " RULES: " +
-                   "Preserve all important facts, constraints, preferences, instructions, and decisions from the existing summary.\r\n2. " +
-                   "Integrate relevant new information from the new message.\r\n3. Do not invent or assume information not present in the inputs.\r\n4. " +
-                   "Output ONLY the updated summary text, no explanations or meta-commentary.\r\n5. Keep the summary concise but complete.\r\n6. " +
-                   "Use clear, factual language.";
+        if (_rolePromptCache.TryGetValue(key, out var cached)
+            && DateTime.UtcNow - cached.LoadedAt < RolePromptCacheDuration)
+        {
+            return cached.Prompts;
         }
 
-        return prompt;
+        UnitOfWork? session = DatabaseHelper.GetSession();
+        if (session == null)
+            return null;
+
+        var prompts = session.Query<SummarizePrompts>()
+            .Where(x => x.Role.ToLower() == key)
+            .Select(x => x.Prompt)
+            .ToList();
+
+        _rolePromptCache[key] = (DateTime.UtcNow, prompts);
+        return prompts;
     }
 }
@@ -1,3 +1,4 @@
+using BackendExecutor.Config;
 using BackendExecutor.Services;
 using NodPT.Data.Services;
 using NodPT.Data.Models;
@@ -6,6 +7,7 @@ using DevExpress.Data.Filtering;
 using NodPT.Data.DTOs;
 using RedisService.Queue;
 using RedisService.Cache;
+using System.Net;
 
 namespace BackendExecutor;
 
@@ -41,31 +43,40 @@ public class ChatStreamWorker : BackgroundService
     private readonly RedisQueueService _redisService;
     private readonly LlmChatService _llmChatService;
     private readonly MemoryService _memoryService;
+    private readonly ExecutorOptions _options;
     private ListenHandle? _listenHandle;
 
     public ChatStreamWorker(
         ILogger<ChatStreamWorker> logger,
         RedisQueueService redisService,
         LlmChatService llmChatService,
-        MemoryService memoryService)
+        MemoryService memoryService,
+        ExecutorOptions options)
     {
         _logger = logger;
         _redisService = redisService;
         _llmChatService = llmChatService;
         _memoryService = memoryService;
+        _options = options;
     }
 
     protected override async Task ExecuteAsync(CancellationToken stoppingToken)
     {
         _logger.LogInformation("ChatStreamWorker starting...");
 
+        // Load the chat model in the background so the first chat job doesn't wait for it
+        _ = Task.Run(() => PreloadChatModelAsync(stoppingToken), stoppingToken);
+
+        // Keep up to LlmMaxBatch jobs in flight so Ollama can batch them across its parallel slots;
+        // the listener reads a new job whenever one finishes
+        var concurrency = Math.Max(1, _options.LlmMaxBatch);
         var options = new ListenOptions
         {
-            BatchSize = 10,
-            Concurrency = 3,
+            BatchSize = concurrency,
+            Concurrency = concurrency,
             ClaimIdleThresholdMs = 60000,
             MaxRetries = 3,
-            PollDelayMs = 1000,
+            PollDelayMs = Math.Max(1, _options.ChatPollDelayMs),
             CreateStreamIfMissing = true,
             ClaimPendingOnStartup = true
         };
@@ -86,6 +97,49 @@ public class ChatStreamWorker : BackgroundService
         await Task.Delay(Timeout.Infinite, stoppingToken);
     }
 
+    /// <summary>
+    /// Preload the model that most active template AIModels point at, on the endpoint they use.
+    /// Jobs take their model from the template's AIModel, so preloading DefaultModel would only
+    /// occupy a loaded-model slot. Nothing is preloaded when no template has an active AIModel yet.
+    /// </summary>
+    private async Task PreloadChatModelAsync(CancellationToken cancellationToken)
+    {
+        (string Model, string Endpoint)? target;
+        try
+        {
+            using var session = DatabaseHelper.GetSession();
+            if (session == null)
+            {
+                _logger.LogWarning("Failed to create database session, skipping model preload");
+                return;
+            }
+
+            // Resolve model and endpoint the same way a chat job does
+            target = session.Query<AIModel>()
+                .Where(am => am.IsActive && am.Template != null)
+                .ToList()
+                .GroupBy(am => (
+                    Model: string.IsNullOrEmpty(am.ModelIdentifier) ? _options.DefaultModel : am.ModelIdentifier,
+                    Endpoint: string.IsNullOrEmpty(am.EndpointAddress) ? _options.LlmEndpoint : am.EndpointAddress))
+                .OrderByDescending(g => g.Count())
+                .Select(g => ((string Model, string Endpoint)?)g.Key)
+                .FirstOrDefault();
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to look up template models, skipping model preload");
+            return;
+        }
+
+        if (target == null)
+        {
+            _logger.LogInformation("No active template AIModel found, skipping model preload");
+            return;
+        }
+
+        await _llmChatService.PreloadModelAsync(target.Value.Model, target.Value.Endpoint, cancellationToken);
+    }
+
     private async Task<bool> HandleChatJob(MessageEnvelope envelope, CancellationToken cancellationToken)
     {
         try
@@ -200,9 +254,11 @@ public class ChatStreamWorker : BackgroundService
                 nodeId, summary.Length, history.Count);
 
             // Step 11: Prepare Ollama data object with messages array
-            var messages = new List<OllamaMessage>();
+            // Sized up front for prompts + summary + history + user message so the list never regrows
+            var messages = new List<OllamaMessage>(promptContents.Count + history.Count + 2);
             
-            // Add system prompts first
+            // Add system prompts first: they are identical across turns, so Ollama can reuse
+            // their cached KV entries and only process the summary, history and new message
             foreach (var promptContent in promptContents)
             {
                 messages.Add(new OllamaMessage { role = "system", content = promptContent });
@@ -263,13 +319,16 @@ public class ChatStreamWorker : BackgroundService
             _logger.LogInformation("ChatId: {ChatId}, Response Length: {Length} chars", chatId, aiResponse.Length);
             
             // Log response preview only at Debug level to avoid exposing sensitive content
-            if (aiResponse.Length > 0 && aiResponse.Length <= 500)
-            {
-                _logger.LogDebug("Response Preview: {ResponsePreview}", aiResponse);
-            }
-            else if (aiResponse.Length > 500)
+            if (_logger.IsEnabled(LogLevel.Debug))
             {
-                _logger.LogDebug("Response Preview (first 500 chars): {ResponsePreview}", aiResponse.Substring(0, 500));
+                if (aiResponse.Length > 0 && aiResponse.Length <= 500)
+                {
+                    _logger.LogDebug("Response Preview: {ResponsePreview}", aiResponse);
+                }
+                else if (aiResponse.Length > 500)
+                {
+                    _logger.LogDebug("Response Preview (first 500 chars): {ResponsePreview}", aiResponse.Substring(0, 500));
+                }
             }
 
             // Step 14-15: Extract content and create new message data from the responsed message
@@ -336,6 +395,12 @@ public class ChatStreamWorker : BackgroundService
             
             return true; // Success, ack the message
         }
+        catch (HttpRequestException ex) when (IsNonRetryableStatus(ex.StatusCode))
+        {
+            // The LLM rejected the request itself (unknown model, context overflow, ...); resending it won't help.
+            // The queue logs this once when it moves the entry to the dead letter stream.
+            throw new NonRetryableMessageException($"LLM rejected chat job: {ex.Message}", ex);
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error processing chat job for entry {EntryId}", envelope.EntryId);
@@ -343,6 +408,20 @@ public class ChatStreamWorker : BackgroundService
         }
     }
 
+    /// <summary>
+    /// Client errors (4xx) mean the request itself is invalid, except timeouts and rate limiting
+    /// </summary>
+    private static bool IsNonRetryableStatus(HttpStatusCode? statusCode)
+    {
+        if (statusCode is not { } status)
+            return false;
+
+        var code = (int)status;
+        return code >= 400 && code < 500
+            && status != HttpStatusCode.RequestTimeout
+            && status != HttpStatusCode.TooManyRequests;
+    }
+
     public override async Task StopAsync(CancellationToken cancellationToken)
     {
         _logger.LogInformation("ChatStreamWorker stopping...");
@@ -35,10 +35,33 @@ public class ExecutorOptions
     /// <summary>
     /// LLM endpoint URL for chat completions
     /// </summary>
-    public string LlmEndpoint { get; set; } = "http://ollama:11434/v1/chat/generate";
+    public string LlmEndpoint { get; set; } = "http://ollama:11434/api/chat";
 
     /// <summary>
     /// Default model name to use for LLM chat completions
     /// </summary>
     public string DefaultModel { get; set; } = "deepseek-r1:1.5b";
+
+    /// <summary>
+    /// Maximum chat jobs sent to the LLM at the same time.
+    /// Keep in line with OLLAMA_NUM_PARALLEL so concurrent requests are batched on the GPU
+    /// </summary>
+    public int LlmMaxBatch { get; set; } = 4;
+
+    /// <summary>
+    /// Maximum seconds a single LLM request may take, including the full generation.
+    /// A stalled request fails after this; the chat job is retried with backoff and moved to jobs:chat:dead after 3 failed attempts
+    /// </summary>
+    public int LlmTimeoutSeconds { get; set; } = 300;
+
+    /// <summary>
+    /// Milliseconds to wait before polling the chat queue again when it is empty
+    /// </summary>
+    public int ChatPollDelayMs { get; set; } = 1000;
+
+    /// <summary>
+    /// How long the LLM server keeps a model loaded after a request (Ollama keep_alive, e.g. "30m").
+    /// Keeping it loaded lets the next chat turn reuse the cached prompt prefix instead of re-processing it
+    /// </summary>
+    public string LlmKeepAlive { get; set; } = "30m";
 }
\ No newline at end of file
@@ -47,8 +47,12 @@ builder.Services.Configure<ExecutorOptions>(options =>
     options.MaxInspector = int.TryParse(Environment.GetEnvironmentVariable("MAX_INSPECTOR"), out var maxInspector) ? maxInspector : 0;
     options.MaxAgent = int.TryParse(Environment.GetEnvironmentVariable("MAX_AGENT"), out var maxAgent) ? maxAgent : 0;
     options.MaxTotal = int.TryParse(Environment.GetEnvironmentVariable("MAX_TOTAL"), out var maxTotal) ? maxTotal : 0;
-    options.LlmEndpoint = Environment.GetEnvironmentVariable("LLM_ENDPOINT") ?? "http://ollama:11434/api/generate";
+    options.LlmEndpoint = Environment.GetEnvironmentVariable("LLM_ENDPOINT") ?? "http://ollama:11434/api/chat";
     options.DefaultModel = Environment.GetEnvironmentVariable("DEFAULT_MODEL") ?? "deepseek-r1:1.5b";
+    options.LlmMaxBatch = int.TryParse(Environment.GetEnvironmentVariable("LLM_MAX_BATCH"), out var llmMaxBatch) ? llmMaxBatch : 4;
+    options.ChatPollDelayMs = int.TryParse(Environment.GetEnvironmentVariable("CHAT_POLL_DELAY_MS"), out var chatPollDelayMs) ? chatPollDelayMs : 1000;
+    options.LlmKeepAlive = Environment.GetEnvironmentVariable("LLM_KEEP_ALIVE") ?? "30m";
+    options.LlmTimeoutSeconds = int.TryParse(Environment.GetEnvironmentVariable("LLM_TIMEOUT_SECONDS"), out var llmTimeoutSeconds) ? llmTimeoutSeconds : 300;
 });
 
 // Register ExecutorOptions as singleton
@@ -65,6 +69,10 @@ builder.Services.AddSingleton<ExecutorOptions>(provider =>
     options.MaxTotal = int.TryParse(Environment.GetEnvironmentVariable("MAX_TOTAL"), out var maxTotal) ? maxTotal : options.MaxTotal;
     options.LlmEndpoint = Environment.GetEnvironmentVariable("LLM_ENDPOINT") ?? options.LlmEndpoint;
     options.DefaultModel = Environment.GetEnvironmentVariable("DEFAULT_MODEL") ?? options.DefaultModel;
+    options.LlmMaxBatch = int.TryParse(Environment.GetEnvironmentVariable("LLM_MAX_BATCH"), out var llmMaxBatch) ? llmMaxBatch : options.LlmMaxBatch;
+    options.ChatPollDelayMs = int.TryParse(Environment.GetEnvironmentVariable("CHAT_POLL_DELAY_MS"), out var chatPollDelayMs) ? chatPollDelayMs : options.ChatPollDelayMs;
+    options.LlmKeepAlive = Environment.GetEnvironmentVariable("LLM_KEEP_ALIVE") ?? options.LlmKeepAlive;
+    options.LlmTimeoutSeconds = int.TryParse(Environment.GetEnvironmentVariable("LLM_TIMEOUT_SECONDS"), out var llmTimeoutSeconds) ? llmTimeoutSeconds : options.LlmTimeoutSeconds;
 
     return options;
 });
@@ -82,6 +90,7 @@ builder.Services.AddSingleton<SummarizationOptions>(provider =>
         options.TimeoutSeconds = timeout;
     if (int.TryParse(Environment.GetEnvironmentVariable("SUMMARIZATION_MAX_LENGTH"), out var maxLen))
         options.MaxSummaryLength = maxLen;
+    options.KeepAlive = Environment.GetEnvironmentVariable("SUMMARIZATION_KEEP_ALIVE") ?? options.KeepAlive;
 
     return options;
 });
@@ -154,15 +163,34 @@ builder.Services.AddSingleton<RedisQueueService>(provider =>
     return new RedisQueueService(multiplexer, logger);
 });
 
+// HTTP handler shared by the LLM and summarization clients, which usually talk to the same Ollama
+// host: both draw from one connection pool, and PooledConnectionLifetime recycles connections so
+// DNS changes are picked up. The typed clients are captured by singletons (ChatStreamWorker,
+// MemoryService), so the factory's handler rotation never applied to them; the infinite handler
+// lifetime only keeps the factory from disposing this shared instance.
+var llmHttpHandler = new SocketsHttpHandler
+{
+    PooledConnectionIdleTimeout = TimeSpan.FromMinutes(5),
+    PooledConnectionLifetime = TimeSpan.FromMinutes(15)
+};
+
 // Register HttpClient for LLM service
-builder.Services.AddHttpClient<LlmChatService, LlmChatService>();
+builder.Services.AddHttpClient<LlmChatService, LlmChatService>((provider, client) =>
+{
+    var options = provider.GetRequiredService<ExecutorOptions>();
+    client.Timeout = TimeSpan.FromSeconds(options.LlmTimeoutSeconds);
+})
+    .ConfigurePrimaryHttpMessageHandler(() => llmHttpHandler)
+    .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 
 // Register HttpClient for SummarizationService
 builder.Services.AddHttpClient<SummarizationService, SummarizationService>((provider, client) =>
 {
     var options = provider.GetRequiredService<SummarizationOptions>();
     client.Timeout = TimeSpan.FromSeconds(options.TimeoutSeconds);
-});
+})
+    .ConfigurePrimaryHttpMessageHandler(() => llmHttpHandler)
+    .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 
 // Register MemoryService
 builder.Services.AddSingleton<MemoryService>(provider =>
@@ -197,6 +225,10 @@ logger.LogInformation("  Max Manager: {MaxManager}", executorOptions.MaxManager
 logger.LogInformation("  Max Inspector: {MaxInspector}", executorOptions.MaxInspector == 0 ? "unlimited" : executorOptions.MaxInspector);
 logger.LogInformation("  Max Agent: {MaxAgent}", executorOptions.MaxAgent == 0 ? "unlimited" : executorOptions.MaxAgent);
 logger.LogInformation("  Max Total: {MaxTotal}", executorOptions.MaxTotal == 0 ? "unlimited" : executorOptions.MaxTotal);
+logger.LogInformation("  LLM Max Batch: {LlmMaxBatch}", executorOptions.LlmMaxBatch);
+logger.LogInformation("  Chat Poll Delay: {ChatPollDelayMs} ms", executorOptions.ChatPollDelayMs);
+logger.LogInformation("  LLM Keep Alive: {LlmKeepAlive}", executorOptions.LlmKeepAlive);
+logger.LogInformation("  LLM Timeout: {LlmTimeoutSeconds} s", executorOptions.LlmTimeoutSeconds);
 logger.LogInformation("  Summarization Base URL: {BaseUrl}", summarizationOptions.BaseUrl);
 logger.LogInformation("  Summarization Model: {Model}", summarizationOptions.Model);
 logger.LogInformation("  Memory History Limit: {HistoryLimit}", memoryOptions.HistoryLimit);
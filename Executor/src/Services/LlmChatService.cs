@@ -1,6 +1,7 @@
 using BackendExecutor.Config;
 using NodPT.Data.DTOs;
 using NodPT.Data.Models;
+using NodPT.Data.Services;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
@@ -84,11 +85,44 @@ public class LlmChatService
             request.options = BuildOptionsFromAIModel(aiModel);
         }
 
+        // Keep the model loaded between turns so Ollama can reuse the KV cache of the unchanged prompt prefix
+        request.keep_alive ??= _options.LlmKeepAlive;
+
         return await SendChatRequestAsync(request, endpoint, cancellationToken);
     }
 
   
 
+    /// <summary>
+    /// Load a model on the LLM server ahead of the first chat job so users don't pay the cold-start load time.
+    /// Ollama loads the model when it receives a request with neither a prompt nor messages.
+    /// </summary>
+    public async Task PreloadModelAsync(
+        string model,
+        string endpoint,
+        CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            using var content = OllamaHttpHelper.CreateJsonContent(new OllamaRequest { model = model, keep_alive = _options.LlmKeepAlive });
+
+            _logger.LogInformation("Preloading model {Model} at {Endpoint}", model, endpoint);
+
+            using var response = await _httpClient.PostAsync(endpoint, content, cancellationToken);
+            await OllamaHttpHelper.EnsureSuccessAsync(response, cancellationToken);
+
+            _logger.LogInformation("Model {Model} is loaded and ready", model);
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Shutting down before the model finished loading
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to preload model {Model}, it will be loaded on the first chat job", model);
+        }
+    }
+
     /// <summary>
     /// Send a structured Ollama request to a specific endpoint
     /// </summary>
@@ -99,44 +133,38 @@ public class LlmChatService
     {
         try
         {
-            var json = JsonSerializer.Serialize(request);
-            var content = new StringContent(json, Encoding.UTF8, "application/json");
+            // Serialize straight to UTF-8 bytes (no intermediate string); the bytes are reused for the debug log below
+            var payload = JsonSerializer.SerializeToUtf8Bytes(request);
+            using var content = OllamaHttpHelper.CreateJsonContent(payload);
 
             _logger.LogInformation("=== Sending Chat Request to LLM ===");
             _logger.LogInformation("Endpoint: {Endpoint}", endpoint);
             _logger.LogInformation("Model: {Model}", request.model);
             _logger.LogInformation("Message Count: {MessageCount}", request.messages?.Count ?? 0);
 
-            // Log request payload only at Debug level to avoid exposing sensitive user data
-            if (json.Length <= 2000)
-            {
-                _logger.LogInformation("Request Payload: {RequestPayload}", json);
-            }
-            else
+            // Log request payload only at Debug level to avoid exposing sensitive user data.
+            // The IsEnabled check skips decoding the payload when Debug logging is off.
+            if (_logger.IsEnabled(LogLevel.Debug))
             {
-                _logger.LogInformation("Request Payload (first 2000 chars): {RequestPayload}", json.Substring(0, 2000));
-                _logger.LogInformation("Request Payload Total Length: {PayloadLength} chars", json.Length);
+                if (payload.Length <= 2000)
+                {
+                    _logger.LogDebug("Request Payload: {RequestPayload}", Encoding.UTF8.GetString(payload));
+                }
+                else
+                {
+                    _logger.LogDebug("Request Payload (first 2000 bytes): {RequestPayload}", Encoding.UTF8.GetString(payload, 0, 2000));
+                    _logger.LogDebug("Request Payload Total Length: {PayloadLength} bytes", payload.Length);
+                }
             }
 
 
             //! Send request to LLM endpoint
-            var response = await _httpClient.PostAsync(endpoint, content, cancellationToken);
-            response.EnsureSuccessStatusCode();
-
-            var responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
-
-            // Log response payload only at Debug level to avoid exposing sensitive content
-            if (responseJson.Length <= 2000)
-            {
-                _logger.LogInformation("Response Payload: {ResponsePayload}", responseJson);
-            }
-            else
-            {
-                _logger.LogInformation("Response Payload (first 2000 chars): {ResponsePayload}", responseJson.Substring(0, 2000));
-                _logger.LogInformation("Response Payload Total Length: {PayloadLength} chars", responseJson.Length);
-            }
+            // The whole completion arrives in one body, so HttpClient.Timeout (LLM_TIMEOUT_SECONDS) bounds the full generation
+            using var response = await _httpClient.PostAsync(endpoint, content, cancellationToken);
+            await OllamaHttpHelper.EnsureSuccessAsync(response, cancellationToken);
 
-            var responseObject = JsonSerializer.Deserialize<OllamaResponse>(responseJson);
+            await using var responseStream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            var responseObject = await JsonSerializer.DeserializeAsync<OllamaResponse>(responseStream, cancellationToken: cancellationToken);
 
             if (responseObject == null)
             {
@@ -145,11 +173,33 @@ public class LlmChatService
             }
 
             var result = responseObject.Content;
+
+            // Log response payload only at Debug level to avoid exposing sensitive content
+            if (_logger.IsEnabled(LogLevel.Debug))
+            {
+                if (result.Length <= 2000)
+                {
+                    _logger.LogDebug("Response Payload: {ResponsePayload}", result);
+                }
+                else
+                {
+                    _logger.LogDebug("Response Payload (first 2000 chars): {ResponsePayload}", result.Substring(0, 2000));
+                    _logger.LogDebug("Response Payload Total Length: {PayloadLength} chars", result.Length);
+                }
+            }
+
             _logger.LogInformation("=== LLM Response Processed ===");
             _logger.LogInformation("Response Content Length: {Length} characters", result.Length);
+            _logger.LogInformation("Token Usage: Prompt={PromptTokens}, Completion={CompletionTokens}",
+                responseObject.prompt_eval_count, responseObject.eval_count);
 
             return result;
         }
+        catch (HttpRequestException ex) when (ex.StatusCode != null)
+        {
+            // The endpoint answered with an error; its body is in the message and the chat job logs it
+            throw;
+        }
         catch (HttpRequestException ex)
         {
             _logger.LogError(ex, "HTTP error while calling LLM endpoint: {Endpoint}", endpoint);